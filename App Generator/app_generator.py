@@ -1,3 +1,6 @@
+import asyncio
+import atexit
+import concurrent.futures
 import subprocess
 import sys
 import shutil
@@ -6,64 +9,213 @@ import os
 import re
 import time
 import datetime
-from rich.console import Console
+import hashlib
+import codecs
+import functools
+import threading
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.syntax import Syntax
-from rich.markdown import Markdown
-from rich.table import Table
-from rich.live import Live
-import webbrowser
 from rich.text import Text
 from rich.style import Style
 
 console = Console()
+# Not shared with the root app_generator.py, which keeps its registry in apps_registry.jsonl
 APPS_REGISTRY_FILE = "apps_registry.json"
+_CODE_BLOCK_RE = re.compile(r"```(?:\w+)?\n(.*?)```", re.DOTALL)
+_STREAMLIT_IMPORT_RE = re.compile(r"^\s*import\s+streamlit", re.MULTILINE)
+# Groups: 1 = HTML, 2 = C++, 3 = Python; the earliest hit decides the language
+_LANG_SNIFF_RE = re.compile(r"(?i:(<html))|(#include)|(^\s*(?:def|import)\s)", re.MULTILINE)
+_SNIFF_EXTS = {1: ".html", 2: ".cpp", 3: ".py"}
+_LEXERS = {".py": "python", ".html": "html", ".cpp": "cpp"}
+_LANG_EXTS = {"python": ".py", "html": ".html", "c++": ".cpp"}
+HEAD_READ_SIZE = 4096  # imports always live at the top of the file
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "app_generator")
+CACHE_TTL = 24 * 60 * 60  # seconds
+DEPS_MARKER = os.path.join(CACHE_DIR, "deps.ok")
+DEPS_TTL = 5 * 60  # seconds
+# Parsed registry, reloaded only when the file's mtime changes.
+# "pending" counts background writes not yet on disk; while non-zero memory is authoritative.
+_REGISTRY_CACHE = {"mtime": 0, "next_id": 1, "list": [], "by_id": {}, "pending": 0, "blocked": False}
+_REGISTRY_LOCK = threading.Lock()
+# A single worker keeps registry writes in submission order
+_writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+atexit.register(_writer.shutdown, wait=True)
+
+@functools.lru_cache(maxsize=None)
+def _have_gh():
+    # A recent successful check recorded in DEPS_MARKER skips the PATH walk
+    try:
+        if time.time() - os.path.getmtime(DEPS_MARKER) < DEPS_TTL:
+            return True
+    except OSError:
+        pass
+    if shutil.which("gh") is None:
+        return False
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(DEPS_MARKER, "a"):
+            pass
+        os.utime(DEPS_MARKER)
+    except OSError:
+        pass
+    return True
 
 def check_dependencies():
     """Check if gh and gh copilot are installed."""
-    if not shutil.which("gh"):
+    if not _have_gh():
         console.print("[bold red]Error:[/bold red] GitHub CLI (gh) is not installed.")
         console.print("Please install it from https://cli.github.com/")
         sys.exit(1)
     pass
 
+def _set_registry_cache(registry, mtime, next_id):
+    _REGISTRY_CACHE["mtime"] = mtime
+    _REGISTRY_CACHE["next_id"] = next_id
+    _REGISTRY_CACHE["list"] = registry
+    _REGISTRY_CACHE["by_id"] = {a["id"]: a for a in registry}
+
 def load_apps_registry():
-    if os.path.exists(APPS_REGISTRY_FILE):
-        try:
-            with open(APPS_REGISTRY_FILE, "r") as f:
-                return json.load(f)
-        except:
-            return []
-    return []
+    """
+    Returns the list of registered apps.
+    The file holds {"next_id": N, "apps": [...]}; legacy plain lists are migrated on load.
+    """
+    with _REGISTRY_LOCK:
+        if _REGISTRY_CACHE["pending"]:
+            return _REGISTRY_CACHE["list"]
+        return _load_apps_registry_locked()
+
+def _load_apps_registry_locked():
+    try:
+        mtime = os.stat(APPS_REGISTRY_FILE).st_mtime
+    except OSError:
+        _set_registry_cache([], 0, 1)
+        return _REGISTRY_CACHE["list"]
+    if mtime == _REGISTRY_CACHE["mtime"]:
+        return _REGISTRY_CACHE["list"]
+    try:
+        with open(APPS_REGISTRY_FILE, "r") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        data = None
+    except OSError as e:
+        # The file may be fine but unreadable right now: keep it and refuse to save over it
+        console.print(f"[bold red]Error reading app registry:[/bold red] {e}")
+        _REGISTRY_CACHE["blocked"] = True
+        _set_registry_cache([], 0, 1)
+        return _REGISTRY_CACHE["list"]
+    if isinstance(data, dict) and isinstance(data.get("apps"), list):
+        registry = data["apps"]
+    elif isinstance(data, list):
+        registry = data
+    else:
+        # Saving over a file that could not be moved aside would destroy it
+        _REGISTRY_CACHE["blocked"] = not _quarantine_registry_file()
+        _set_registry_cache([], 0, 1)
+        return _REGISTRY_CACHE["list"]
+    _REGISTRY_CACHE["blocked"] = False
+    registry = [a for a in registry if isinstance(a, dict) and "id" in a]
+    next_id = max((int(a["id"]) for a in registry if str(a["id"]).isdigit()), default=0) + 1
+    if isinstance(data, dict) and isinstance(data.get("next_id"), int):
+        next_id = max(next_id, data["next_id"])
+    _set_registry_cache(registry, mtime, next_id)
+    return registry
+
+def _quarantine_registry_file():
+    """Moves an unreadable registry aside so the next save cannot overwrite it. Returns True on success."""
+    corrupt_path = f"{APPS_REGISTRY_FILE}.{datetime.datetime.now():%Y%m%d-%H%M%S}.corrupt"
+    try:
+        os.replace(APPS_REGISTRY_FILE, corrupt_path)
+        console.print(f"[bold yellow]Warning:[/bold yellow] {APPS_REGISTRY_FILE} was unreadable and was moved to {corrupt_path}.")
+        return True
+    except OSError as e:
+        console.print(f"[bold red]Error:[/bold red] {APPS_REGISTRY_FILE} is unreadable and could not be moved aside: {e}")
+        return False
+
+def get_app_by_id(app_id):
+    load_apps_registry()
+    return _REGISTRY_CACHE["by_id"].get(app_id)
 
-def save_apps_registry(registry):
-    with open(APPS_REGISTRY_FILE, "w") as f:
-        json.dump(registry, f, indent=4)
+def _write_registry_file(registry, next_id):
+    tmp_path = APPS_REGISTRY_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"next_id": next_id, "apps": registry}, f, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, APPS_REGISTRY_FILE)
+    return os.stat(APPS_REGISTRY_FILE).st_mtime
+
+def _save_registry_snapshot(registry, next_id):
+    with _REGISTRY_LOCK:
+        try:
+            if _REGISTRY_CACHE["blocked"]:
+                raise OSError(f"{APPS_REGISTRY_FILE} is unreadable; not overwriting it")
+            _REGISTRY_CACHE["mtime"] = _write_registry_file(registry, next_id)
+        except OSError as e:
+            console.print(f"[bold red]Error saving app registry:[/bold red] {e}")
+        finally:
+            _REGISTRY_CACHE["pending"] -= 1
 
 def add_app_to_registry(name, description, language, path):
     registry = load_apps_registry()
+    app_id = _REGISTRY_CACHE["next_id"]
+    _REGISTRY_CACHE["next_id"] = app_id + 1
     app_entry = {
-        "id": str(len(registry) + 1),
+        "id": str(app_id),
         "name": name,
         "description": description,
         "language": language,
-        "path": os.path.abspath(path),
+        "path": path if os.path.isabs(path) else os.path.abspath(path),
         "created_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
-    registry.append(app_entry)
-    save_apps_registry(registry)
+    # Update memory now and persist in the background so the UI returns immediately
+    with _REGISTRY_LOCK:
+        registry.append(app_entry)
+        _REGISTRY_CACHE["by_id"][app_entry["id"]] = app_entry
+        _REGISTRY_CACHE["pending"] += 1
+        snapshot = list(registry)
+    _writer.submit(_save_registry_snapshot, snapshot, app_id + 1)
+    return app_entry
 
+@functools.lru_cache(maxsize=64)
 def extract_code(markdown_text):
     """
     Extracts the first code block from markdown text.
     """
-    code_block_pattern = r"```(?:\w+)?\n(.*?)```"
-    match = re.search(code_block_pattern, markdown_text, re.DOTALL)
+    match = _CODE_BLOCK_RE.search(markdown_text)
     if match:
         return match.group(1).strip()
     return None
 
+def render_suggestion(markdown_text, language):
+    """
+    Renders a Copilot response, highlighting the first code block with Syntax
+    so only the surrounding prose goes through the Markdown parser.
+    """
+    from rich.markdown import Markdown
+    from rich.syntax import Syntax
+
+    match = _CODE_BLOCK_RE.search(markdown_text)
+    if not match:
+        return Markdown(markdown_text)
+
+    code = match.group(1).strip()
+    ext = _LANG_EXTS.get(language.lower())
+    if not ext:
+        sniff = _LANG_SNIFF_RE.search(code)
+        ext = _SNIFF_EXTS[sniff.lastindex] if sniff else None
+    syntax = Syntax(code, _LEXERS.get(ext, "text"), theme="monokai", line_numbers=False)
+
+    # Keep the response order: prose before the block, the code, then prose after it
+    start, end = match.span()
+    prefix = markdown_text[:start].strip()
+    suffix = markdown_text[end:].strip()
+    parts = [Markdown(prefix)] if prefix else []
+    parts.append(syntax)
+    if suffix:
+        parts.append(Markdown(suffix))
+    return Group(*parts) if len(parts) > 1 else syntax
+
 def run_app(app_entry):
     """
     Runs the app based on its language.
@@ -77,14 +229,15 @@ def run_app(app_entry):
         if language == "python" or file_path.endswith(".py"):
              # Heuristic: if it imports streamlit, run with streamlit
              with open(file_path, "r", encoding="utf-8") as f:
-                 content = f.read()
-                 if "import streamlit" in content:
-                     subprocess.run(["streamlit", "run", file_path], check=True)
-                 else:
-                     subprocess.run(["python", file_path], check=True)
+                 head = f.read(HEAD_READ_SIZE)
+             if _STREAMLIT_IMPORT_RE.search(head):
+                 subprocess.run(["streamlit", "run", file_path], check=True)
+             else:
+                 subprocess.run(["python", file_path], check=True)
         elif language == "html" or file_path.endswith(".html"):
              # Open in default browser
-             url = "file://" + os.path.abspath(file_path)
+             import webbrowser
+             url = "file://" + file_path
              console.print(f"[green]Opening {url}...[/green]")
              webbrowser.open(url)
         elif language == "c++" or file_path.endswith(".cpp"):
@@ -94,34 +247,83 @@ def run_app(app_entry):
                  return
 
              exe_path = file_path.replace(".cpp", ".exe" if sys.platform == "win32" else "")
-             console.print("[cyan]Compiling...[/cyan]")
-             
-             compile_result = subprocess.run(["g++", file_path, "-o", exe_path], capture_output=True, text=True)
-             
-             if compile_result.returncode != 0:
-                 console.print("[bold red]Compilation Failed:[/bold red]")
-                 console.print(compile_result.stderr)
-                 return
+             hash_path = exe_path + ".hash"
+             with open(file_path, "rb") as f:
+                 source_hash = hashlib.sha256(f.read()).hexdigest()
+
+             # Skip the compiler when the source is unchanged since the last build
+             previous_hash = None
+             if os.path.exists(exe_path):
+                 try:
+                     with open(hash_path, "r") as f:
+                         previous_hash = f.read().strip()
+                 except OSError:
+                     pass
+
+             if previous_hash == source_hash:
+                 console.print("[cyan]Source unchanged, reusing previous build.[/cyan]")
+             else:
+                 console.print("[cyan]Compiling...[/cyan]")
+                 
+                 compile_result = subprocess.run(
+                     ["g++", "-O2", "-pipe", "-std=c++17", file_path, "-o", exe_path],
+                     capture_output=True, text=True
+                 )
+                 
+                 if compile_result.returncode != 0:
+                     console.print("[bold red]Compilation Failed:[/bold red]")
+                     console.print(compile_result.stderr)
+                     return
+
+                 with open(hash_path, "w") as f:
+                     f.write(source_hash)
 
              console.print("[cyan]Running in new console...[/cyan]")
              
              if sys.platform == "win32":
-                 os.system(f'start cmd /k "{exe_path}"')
+                 # Empty "" is the window title argument expected by start
+                 subprocess.Popen(["cmd", "/c", "start", "", "cmd", "/k", exe_path])
              else:
                  # Linux/Mac
                  subprocess.run([exe_path])
         else:
             console.print(f"[yellow]Unknown runner for language {language}. Opening file...[/yellow]")
             if sys.platform == "win32":
-                 os.startfile(file_path)
+                 try:
+                     os.startfile(file_path)
+                 except OSError as e:
+                     console.print(f"[bold red]Could not open file:[/bold red] {e}")
     except KeyboardInterrupt:
         console.print("\n[yellow]App stopped.[/yellow]")
     except Exception as e:
         console.print(f"[bold red]Error running app:[/bold red] {e}")
 
-def get_copilot_suggestion(query, language):
+def _cache_path(prompt):
+    return os.path.join(CACHE_DIR, hashlib.sha256(prompt.encode("utf-8")).hexdigest() + ".txt")
+
+def _read_cached_suggestion(path):
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+    except OSError:
+        pass
+    return None
+
+def _write_cached_suggestion(path, suggestion):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(suggestion)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+async def get_copilot_suggestion_async(query, language, on_output=None):
     """
-    Get a suggestion from GitHub Copilot CLI.
+    Get a suggestion from GitHub Copilot CLI without blocking the event loop.
+    If on_output is given, it is called with the text received so far as output arrives.
     """
     lang_instruction = ""
     if language.lower() == "python":
@@ -130,34 +332,118 @@ def get_copilot_suggestion(query, language):
         lang_instruction = "Write a complete, single-file HTML application (with embedded CSS/JS if needed)."
     elif language.lower() == "c++":
         lang_instruction = "Write a complete, single-file C++ console application."
-    else: # Auto
-        lang_instruction = "Write a complete, single-file application in the most suitable language (Python Streamlit, HTML, or C++)."
+    else: # Fallback for other languages (Auto mode races the three above instead)
+        lang_instruction = f"Write a complete, single-file application in {language}."
 
     full_prompt = (
         f"{lang_instruction} Request: {query}. "
         "The code must be self-contained. "
         "Return the code in a single markdown code block."
     )
+
+    # Identical prompts are answered from the on-disk cache (set APPGEN_NO_CACHE to bypass)
+    use_cache = not os.environ.get("APPGEN_NO_CACHE")
+    cache_path = _cache_path(full_prompt)
+    if use_cache:
+        cached = _read_cached_suggestion(cache_path)
+        if cached:
+            return cached
     
-    cmd = ["gh", "copilot", "-p", full_prompt, "--silent"]
-    
+    process = None
+    stderr_task = None
     try:
-        process = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            shell=True
+        process = await asyncio.create_subprocess_exec(
+            "gh", "copilot", "-p", full_prompt, "--silent",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
+        # Drain stderr concurrently so a chatty stderr cannot block stdout
+        stderr_task = asyncio.create_task(process.stderr.read())
+        # Fixed-size reads rather than readline(), which rejects lines over 64 KiB (e.g. minified HTML)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        buf = ""
+        while True:
+            chunk = await process.stdout.read(65536)
+            if not chunk:
+                break
+            buf += decoder.decode(chunk)
+            if on_output:
+                on_output(buf)
+        buf += decoder.decode(b"", final=True)
+        await process.wait()
+        err = await stderr_task
         
-        if process.returncode == 0 and process.stdout.strip():
-            return process.stdout.strip()
-        elif process.stderr.strip():
-             return f"Error/Message: {process.stderr.strip()}"
+        # stderr is only decoded on failure, so warnings on success are ignored
+        if process.returncode != 0:
+            return f"Error: {err.decode('utf-8', errors='replace').strip()[:500]}"
         
-        return None
+        stdout = buf.strip()
+        if not stdout:
+            return None
+        if use_cache:
+            _write_cached_suggestion(cache_path, stdout)
+        return stdout
     except Exception as e:
         return f"Execution Error: {str(e)}"
+    finally:
+        # On errors or cancellation, don't leave gh or the stderr reader behind
+        if process is not None and process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+        if stderr_task is not None and not stderr_task.done():
+            stderr_task.cancel()
+            try:
+                await stderr_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+async def _first_suggestion_with_code(query, languages):
+    """
+    Requests all languages concurrently and returns the first answer containing a code block.
+    The remaining requests are cancelled, which kills their gh processes.
+    Falls back to the first non-empty answer (e.g. an error message) if none has code.
+    """
+    pending = {asyncio.create_task(get_copilot_suggestion_async(query, lang)) for lang in languages}
+    fallback = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if result and extract_code(result):
+                    return result
+                fallback = fallback or result
+        return fallback
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+def get_copilot_suggestion(query, language):
+    """
+    Get a suggestion from GitHub Copilot CLI.
+    In Auto mode, Python, HTML and C++ are requested in parallel and the first answer with code wins.
+    """
+    if language.lower() != "auto":
+        # Render the response progressively instead of waiting behind a spinner
+        from rich.live import Live
+        from rich.markdown import Markdown
+        with Live(console=console, refresh_per_second=10, transient=True) as live:
+            last_update = 0.0
+            def on_output(buf):
+                nonlocal last_update
+                now = time.monotonic()
+                if now - last_update >= 0.1:
+                    live.update(Markdown(buf))
+                    last_update = now
+            return asyncio.run(get_copilot_suggestion_async(query, language, on_output))
+
+    with console.status("[bold cyan]Consulting GitHub Copilot...[/bold cyan]", spinner="dots"):
+        return asyncio.run(_first_suggestion_with_code(query, ("Python", "HTML", "C++")))
 
 def show_splash_screen():
     
@@ -166,25 +452,32 @@ def show_splash_screen():
     credits.stylize("magenta", 48, 58) # LegendsDaD
     credits.stylize("cyan", 63) # Amit Manna 99
 
+    from rich.live import Live
+
+    body = Text.assemble(title, "\n", credits, justify="center")
     panel = Panel(
-        Text.assemble(title, "\n", credits, justify="center"),
+        body,
         border_style="blue",
         padding=(1, 2)
     )
+
+    # Skip the animation when piped or when disabled with APPGEN_SPLASH=0
+    if not sys.stdout.isatty() or os.environ.get("APPGEN_SPLASH") == "0":
+        console.print(panel)
+        return
     
     # Dynamic animation effect
     colors = ["red", "yellow", "green", "cyan", "blue", "magenta"]
-    with Live(panel, refresh_per_second=10) as live:
-        for i in range(20): 
+    with Live(panel, refresh_per_second=20) as live:
+        for i in range(10): 
             # Cycle border color
             panel.border_style = colors[i % len(colors)]
             
-            # Cycle title color
-            title.style = Style(color=colors[(i + 1) % len(colors)], bold=True)
-            panel.renderable = Text.assemble(title, "\n", credits, justify="center")
+            # Cycle title color (later spans override earlier ones)
+            body.stylize(Style(color=colors[(i + 1) % len(colors)], bold=True), 0, len(title))
             
             live.update(panel)
-            time.sleep(0.1)
+            time.sleep(0.05)
             
     console.clear()
     console.print(panel)
@@ -211,15 +504,16 @@ def main():
                 console.print("[yellow]No apps found in registry.[/yellow]")
                 continue
                 
+            from rich.table import Table
             table = Table(title="Generated Apps")
             table.add_column("ID", style="cyan")
             table.add_column("Name", style="green")
             table.add_column("Language", style="magenta")
-            table.add_column("Description")
+            table.add_column("Description", overflow="ellipsis", no_wrap=True, max_width=50)
             table.add_column("Created At")
             
             for app in registry:
-                table.add_row(app["id"], app["name"], app["language"], app["description"][:50], app["created_at"])
+                table.add_row(app["id"], app["name"], app["language"], app["description"], app["created_at"])
                 
             console.print(table)
             
@@ -227,7 +521,7 @@ def main():
             if app_id.lower() == 'back':
                 continue
                 
-            selected_app = next((a for a in registry if a["id"] == app_id), None)
+            selected_app = get_app_by_id(app_id)
             if selected_app:
                 run_app(selected_app)
             else:
@@ -252,14 +546,13 @@ def main():
         lang_map = {"1": "Python", "2": "HTML", "3": "C++", "4": "Auto"}
         selected_language = lang_map[lang_choice]
 
-        with console.status("[bold cyan]Consulting GitHub Copilot...[/bold cyan]", spinner="dots"):
-            suggestion = get_copilot_suggestion(user_query, selected_language)
+        suggestion = get_copilot_suggestion(user_query, selected_language)
 
         if suggestion:
             extracted_code = extract_code(suggestion)
             
             console.print("\n[bold cyan]Copilot Response:[/bold cyan]")
-            console.print(Panel(Markdown(suggestion), border_style="green"))
+            console.print(Panel(render_suggestion(suggestion, selected_language), border_style="green"))
 
             if extracted_code:
                 if Confirm.ask("\n[bold yellow]Code detected. Do you want to save and run this app?[/bold yellow]"):
@@ -268,9 +561,10 @@ def main():
                     if selected_language == "HTML": ext = ".html"
                     elif selected_language == "C++": ext = ".cpp"
                     elif selected_language == "Auto":
-                        if "def " in extracted_code or "import " in extracted_code: ext = ".py"
-                        elif "<html>" in extracted_code.lower(): ext = ".html"
-                        elif "#include" in extracted_code: ext = ".cpp"
+                        # Only the first lines are needed to tell the languages apart
+                        code_head = "\n".join(extracted_code.split("\n", 20)[:20])
+                        sniff = _LANG_SNIFF_RE.search(code_head)
+                        if sniff: ext = _SNIFF_EXTS[sniff.lastindex]
                     
                     default_filename = f"generated_app_{int(time.time())}{ext}"
                     filename = Prompt.ask("Enter filename to save", default=default_filename)
@@ -290,16 +584,10 @@ def main():
                         console.print(f"[bold green]File saved to {filename}[/bold green]")
                         
                         # Add to registry
-                        add_app_to_registry(filename, user_query, selected_language, filename)
+                        new_entry = add_app_to_registry(filename, user_query, selected_language, filename)
                         
                         if Confirm.ask("Run this app now?"):
-                            # Create a temporary app entry to run it immediately
-                            temp_entry = {
-                                "name": filename,
-                                "path": os.path.abspath(filename),
-                                "language": selected_language
-                            }
-                            run_app(temp_entry)
+                            run_app(new_entry)
                     except Exception as e:
                         console.print(f"[bold red]Error saving file:[/bold red] {e}")
 
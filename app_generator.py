@@ -6,14 +6,13 @@ import os
 import re
 import time
 import datetime
+import atexit
+import hashlib
+from importlib.metadata import distribution, PackageNotFoundError
+from importlib.util import find_spec
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.syntax import Syntax
-from rich.markdown import Markdown
-from rich.table import Table
-from rich.live import Live
-import webbrowser
 from rich.align import Align
 from rich.text import Text
 from rich.style import Style
@@ -21,16 +20,115 @@ import questionary
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 import random
 from rich.layout import Layout
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 console = Console()
-APPS_REGISTRY_FILE = "apps_registry.json"
+# One JSON object per line, so adding an app is a single append
+APPS_REGISTRY_FILE = "apps_registry.jsonl"
+# Only read while apps_registry.jsonl does not exist; the first add migrates its apps.
+# The App Generator/ copy keeps its own registry in this file, so apps it creates after
+# the migration are not listed here: the two copies no longer share a registry.
+LEGACY_APPS_REGISTRY_FILE = "apps_registry.json"
+# Parsed registry, valid while the file's path and st_mtime_ns are unchanged
+_REGISTRY_CACHE = {"path": None, "mtime": None, "data": None, "bad_lines": 0}
+# The generator never changes directory, so the cwd is resolved once
+_CWD = os.getcwd()
+CHROMEDRIVER_CACHE_FILE = ".chromedriver_cache.json"
+_CHROMEDRIVER_PATH = None
+_CHROMEDRIVER_FROM_DISK = False  # path came from CHROMEDRIVER_CACHE_FILE and may be stale
+_DRIVER = None
+# Waits in-browser for the Ace editor and the Run button, then injects the code and clicks Run.
+# The code arrives as arguments[0], serialized by Selenium, so it never needs JS string escaping.
+_PROGRAMIZ_RUN_JS = """
+const code = arguments[0];
+const done = arguments[arguments.length - 1];
+(function wait() {
+    const editor = document.getElementById("editor");
+    const runButton = Array.from(document.querySelectorAll("button"))
+        .find(b => b.textContent.includes("Run") && !b.disabled);
+    if (window.ace && editor && runButton) {
+        ace.edit("editor").setValue(code);
+        runButton.click();
+        done(true);
+    } else {
+        setTimeout(wait, 50);
+    }
+})();
+"""
+_CODE_BLOCK_RE = re.compile(r"```\s*(\w+)?\s*\n(.*?)```", re.DOTALL)
+_FIRST_CODE_BLOCK_RE = re.compile(r"```(?:\w+)?\n(.*?)```", re.DOTALL)
+_REQ_RE = re.compile(r"#\s*requirements:\s*(.*)", re.IGNORECASE)
+_IMPORT_RE = re.compile(r"^import (\w+)|^from (\w+)", re.MULTILINE)
+HEAD_READ_SIZE = 4096  # the requirements comment and imports live at the top of the file
+# Module names that never need a pip install (stdlib names require Python 3.10+)
+_BUILTINS = frozenset(sys.builtin_module_names) | getattr(sys, "stdlib_module_names", frozenset())
+_REQ_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_MENU_STYLE = questionary.Style([
+    ('qmark', 'fg:#E91E63 bold'),       # pink
+    ('question', 'fg:#673AB7 bold'),    # purple
+    ('answer', 'fg:#2196f3 bold'),      # blue
+    ('pointer', 'fg:#673AB7 bold'),     # purple
+    ('highlighted', 'fg:#E91E63 bold'), # pink
+    ('selected', 'fg:#cc5454'),         # orange
+    ('separator', 'fg:#cc5454'),
+    ('instruction', 'fg:#a0a0a0 italic')
+])
+_GH_PATH = None
+_WARM_UP_PROCESS = None
+
+def _gh_executable():
+    """
+    Returns the full path to gh, resolved once so later spawns skip the PATH search.
+    """
+    global _GH_PATH
+    if _GH_PATH is None:
+        _GH_PATH = shutil.which("gh")
+    return _GH_PATH or "gh"
+
+def run_copilot_prompt(prompt):
+    """
+    Runs a single non-interactive gh copilot prompt and returns the CompletedProcess.
+    """
+    _reap_warm_up()
+    return subprocess.run(
+        [_gh_executable(), "copilot", "-p", prompt, "--silent"],
+        capture_output=True,
+        text=True,
+        encoding='utf-8'
+    )
+
+def warm_up_copilot():
+    """
+    Starts gh in the background so its binary is already in the OS cache for the first real prompt.
+    """
+    global _WARM_UP_PROCESS
+    try:
+        _WARM_UP_PROCESS = subprocess.Popen(
+            [_gh_executable(), "copilot", "--help"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL
+        )
+    except OSError:
+        pass
+
+def _reap_warm_up(wait=False):
+    global _WARM_UP_PROCESS
+    if _WARM_UP_PROCESS is None:
+        return
+    if wait:
+        try:
+            _WARM_UP_PROCESS.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            _WARM_UP_PROCESS.kill()
+            _WARM_UP_PROCESS.wait()
+    if _WARM_UP_PROCESS.poll() is not None:
+        _WARM_UP_PROCESS = None
+
+atexit.register(_reap_warm_up, wait=True)
 
 def check_dependencies():
     """Check if gh and gh copilot are installed."""
@@ -40,40 +138,137 @@ def check_dependencies():
         sys.exit(1)
     pass
 
+def _abs(path):
+    return path if os.path.isabs(path) else os.path.normpath(os.path.join(_CWD, path))
+
+def _read_registry_file(path):
+    """
+    Reads a registry in any of the formats found on disk:
+    JSON Lines, a legacy JSON array, or the {"next_id", "apps"} wrapper.
+    Returns (apps, number of unreadable lines skipped).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        # Legacy registries are a single JSON array
+        if f.read(1) == "[":
+            f.seek(0)
+            return json.load(f), 0
+        f.seek(0)
+        apps = []
+        bad_lines = 0
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                # e.g. a partial line left by a crash mid-append; keep the rest of the registry
+                bad_lines += 1
+                continue
+            if isinstance(obj, dict) and isinstance(obj.get("apps"), list):
+                # {"next_id": N, "apps": [...]}, as written by the App Generator/ copy
+                apps.extend(obj["apps"])
+            else:
+                apps.append(obj)
+        return apps, bad_lines
+
+def _next_app_id(registry):
+    return max((int(a["id"]) for a in registry if str(a.get("id", "")).isdigit()), default=0) + 1
+
 def load_apps_registry():
-    if os.path.exists(APPS_REGISTRY_FILE):
+    for path in (APPS_REGISTRY_FILE, LEGACY_APPS_REGISTRY_FILE):
         try:
-            with open(APPS_REGISTRY_FILE, "r") as f:
-                return json.load(f)
-        except:
-            return []
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        if _REGISTRY_CACHE["path"] == path and _REGISTRY_CACHE["mtime"] == mtime:
+            return _REGISTRY_CACHE["data"]
+        try:
+            data, bad_lines = _read_registry_file(path)
+        except FileNotFoundError:
+            # Removed between stat() and open()
+            continue
+        except json.JSONDecodeError:
+            data, bad_lines = [], 0
+        if bad_lines:
+            # Only printed when the file is re-read; the next add rewrites it without them
+            console.print(f"[yellow]Skipped {bad_lines} unreadable line(s) in {path}.[/yellow]")
+        _REGISTRY_CACHE.update(path=path, mtime=mtime, data=data, bad_lines=bad_lines)
+        return data
     return []
 
 def save_apps_registry(registry):
-    with open(APPS_REGISTRY_FILE, "w") as f:
-        json.dump(registry, f, indent=4)
+    with open(APPS_REGISTRY_FILE, "w", encoding="utf-8") as f:
+        for app in registry:
+            # Keys starting with "_" are in-memory display caches, not registry data
+            f.write(json.dumps({k: v for k, v in app.items() if not k.startswith("_")}) + "\n")
+    _REGISTRY_CACHE.update(path=APPS_REGISTRY_FILE, mtime=os.stat(APPS_REGISTRY_FILE).st_mtime_ns,
+                           data=registry, bad_lines=0)
 
 def add_app_to_registry(name, description, language, path, features=None):
     registry = load_apps_registry()
     app_entry = {
-        "id": str(len(registry) + 1),
+        "id": str(_next_app_id(registry)),
         "name": name,
         "description": description,
         "language": language,
-        "path": os.path.abspath(path),
+        "path": _abs(path),
         "features": features or [],
         "created_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
-    registry.append(app_entry)
-    save_apps_registry(registry)
+    if registry and not os.path.exists(APPS_REGISTRY_FILE):
+        # First write after upgrading: carry over the apps from the legacy file
+        save_apps_registry(registry + [app_entry])
+        return
+    if _REGISTRY_CACHE["bad_lines"] and _REGISTRY_CACHE["path"] == APPS_REGISTRY_FILE:
+        # Rewrite once to drop the unreadable lines instead of appending after them
+        save_apps_registry(registry + [app_entry])
+        return
+    with open(APPS_REGISTRY_FILE, "ab+") as f:
+        # Terminate a partial last line first so the new entry stays on its own line
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write((json.dumps(app_entry) + "\n").encode("utf-8"))
+    # Keep the parsed registry current so the next load does not re-read the whole file
+    if _REGISTRY_CACHE["path"] == APPS_REGISTRY_FILE and _REGISTRY_CACHE["data"] is registry:
+        registry.append(app_entry)
+        _REGISTRY_CACHE["mtime"] = os.stat(APPS_REGISTRY_FILE).st_mtime_ns
+    else:
+        _REGISTRY_CACHE["mtime"] = None
+
+def _write_if_changed(path, data):
+    """
+    Writes text to path (UTF-8, platform newlines) unless the file already holds exactly that content.
+    Returns True if the file was written.
+    """
+    encoded = data.replace("\n", os.linesep).encode("utf-8")
+    try:
+        if os.path.getsize(path) == len(encoded):
+            with open(path, "rb") as f:
+                if f.read() == encoded:
+                    return False
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(encoded)
+    return True
+
+def _short_features(app):
+    """
+    Returns the truncated features column for the apps table, memoized on the (cached) registry entry.
+    """
+    short = app.get("_features_short")
+    if short is None:
+        short = app["_features_short"] = ", ".join(app.get("features", []))[:30]
+    return short
 
 def extract_code_blocks(markdown_text):
     """
     Extracts all code blocks from markdown text.
     Returns a list of (language, code) tuples.
     """
-    code_block_pattern = r"```\s*(\w+)?\s*\n(.*?)```"
-    matches = re.findall(code_block_pattern, markdown_text, re.DOTALL)
+    matches = _CODE_BLOCK_RE.findall(markdown_text)
     results = []
     for lang, code in matches:
         results.append((lang.strip(), code.strip()))
@@ -83,12 +278,124 @@ def extract_code(markdown_text):
     """
     Extracts the first code block from markdown text.
     """
-    code_block_pattern = r"```(?:\w+)?\n(.*?)```"
-    match = re.search(code_block_pattern, markdown_text, re.DOTALL)
+    match = _FIRST_CODE_BLOCK_RE.search(markdown_text)
     if match:
         return match.group(1).strip()
     return None
 
+def _get_chromedriver(refresh=False):
+    """
+    Returns the ChromeDriver binary path, resolving it with ChromeDriverManager only
+    when neither the in-memory nor the on-disk cache holds a path that still exists.
+    With refresh=True both caches are dropped first (e.g. after Chrome updated itself).
+    """
+    global _CHROMEDRIVER_PATH, _CHROMEDRIVER_FROM_DISK
+    if refresh:
+        _CHROMEDRIVER_PATH = None
+        try:
+            os.remove(CHROMEDRIVER_CACHE_FILE)
+        except OSError:
+            pass
+    elif _CHROMEDRIVER_PATH and os.path.exists(_CHROMEDRIVER_PATH):
+        return _CHROMEDRIVER_PATH
+    else:
+        try:
+            with open(CHROMEDRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+                cached_path = json.load(f).get("path")
+            if cached_path and os.path.exists(cached_path):
+                _CHROMEDRIVER_PATH = cached_path
+                _CHROMEDRIVER_FROM_DISK = True
+                return _CHROMEDRIVER_PATH
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    # Quiet webdriver-manager and keep its driver cache in the project directory
+    os.environ.setdefault("WDM_LOG", "0")
+    os.environ.setdefault("WDM_LOG_LEVEL", "0")
+    os.environ.setdefault("WDM_PROGRESS_BAR", "0")
+    os.environ.setdefault("WDM_LOCAL", "1")
+    _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+    _CHROMEDRIVER_FROM_DISK = False
+    try:
+        with open(CHROMEDRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"path": _CHROMEDRIVER_PATH}, f)
+    except OSError:
+        pass
+    return _CHROMEDRIVER_PATH
+
+def _get_driver():
+    """
+    Returns the session-wide Chrome WebDriver, starting a new one if none is alive.
+    """
+    global _DRIVER
+    if _DRIVER is not None:
+        try:
+            _DRIVER.current_url  # raises if the browser or the active tab was closed
+            return _DRIVER
+        except Exception:
+            pass
+        try:
+            # The active tab was closed but Chrome is still open: move to a remaining tab
+            handles = _DRIVER.window_handles
+            if handles:
+                _DRIVER.switch_to.window(handles[-1])
+                return _DRIVER
+        except Exception:
+            pass
+        # Browser is gone; quit so the chromedriver process is not orphaned
+        try:
+            _DRIVER.quit()
+        except Exception:
+            pass
+        _DRIVER = None
+
+    options = webdriver.ChromeOptions()
+    if os.environ.get("APPGEN_HEADLESS") == "1":
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+    else:
+        options.add_argument("--start-maximized")
+    
+    # Only the editor and the Run button are needed, so skip images and extensions
+    options.add_argument("--disable-extensions")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    
+    # Suppress logging
+    options.add_argument("--log-level=3")
+    
+    try:
+        _DRIVER = webdriver.Chrome(service=ChromeService(_get_chromedriver()), options=options)
+    except Exception:
+        if not _CHROMEDRIVER_FROM_DISK:
+            raise
+        # The cached driver may no longer match a Chrome that auto-updated; re-resolve once
+        _DRIVER = webdriver.Chrome(service=ChromeService(_get_chromedriver(refresh=True)), options=options)
+    return _DRIVER
+
+def _quit_driver():
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        except Exception:
+            pass
+
+atexit.register(_quit_driver)
+
+def _needs_install(requirement):
+    """
+    Returns True if the package named in a requirement string (e.g. 'pandas>=2.0') is not installed.
+    Version specifiers are not checked.
+    """
+    match = _REQ_NAME_RE.match(requirement)
+    if not match:
+        return True
+    try:
+        distribution(match.group(1))
+        return False
+    except PackageNotFoundError:
+        return True
+
 def run_online_cpp_programiz(code_content):
     """
     Automates running C++ code on Programiz online compiler.
@@ -97,155 +404,216 @@ def run_online_cpp_programiz(code_content):
     console.print("[dim]This requires Chrome browser installed.[/dim]")
     
     try:
-        options = webdriver.ChromeOptions()
-        options.add_argument("--start-maximized")
-        # Keep browser open after script finishes
-        options.add_experimental_option("detach", True) 
-        
-        # Suppress logging
-        options.add_argument("--log-level=3")
-        
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+        # Reuse the running browser; each run gets its own tab
+        driver = _get_driver()
+        if driver.current_url != "data:,":
+            driver.switch_to.new_window("tab")
         
         url = "https://www.programiz.com/cpp-programming/online-compiler/"
         console.print(f"[green]Opening {url}...[/green]")
         driver.get(url)
 
-        # Wait for editor
-        wait = WebDriverWait(driver, 15)
-        # Programiz uses Ace editor, typically in a #editor div
-        wait.until(EC.presence_of_element_located((By.ID, "editor")))
-        
-        console.print("[cyan]Injecting code into editor...[/cyan]")
-        # Escape backticks and backslashes for JS string
-        safe_code = code_content.replace("\\", "\\\\").replace("`", "\\`")
-        
-        # Use Ace API to set value
-        driver.execute_script(f'ace.edit("editor").setValue(`{safe_code}`);')
-        
-        console.print("[cyan]Clicking Run button...[/cyan]")
-        # Find Run button - it usually has text "Run"
-        run_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Run')]")))
-        run_button.click()
+        console.print("[cyan]Injecting code and clicking Run...[/cyan]")
+        # Programiz uses Ace editor in a #editor div; poll for it inside the page, up to 15s
+        driver.set_script_timeout(15)
+        driver.execute_async_script(_PROGRAMIZ_RUN_JS, code_content)
         
         console.print("[bold green]Code submitted! Check the browser window for output.[/bold green]")
         
     except Exception as e:
         console.print(f"[bold red]Automation Error:[/bold red] {e}")
         console.print("[yellow]Falling back to opening the website only...[/yellow]")
+        import webbrowser
         webbrowser.open("https://www.programiz.com/cpp-programming/online-compiler/")
 
+def _run_foreground(cmd):
+    """
+    Runs cmd attached to this terminal and waits for it.
+    On Ctrl-C the child is terminated (killed after 3s) before the interrupt propagates.
+    Raises CalledProcessError on a non-zero exit, like subprocess.run(check=True).
+    """
+    process = subprocess.Popen(cmd)
+    try:
+        returncode = process.wait()
+    except KeyboardInterrupt:
+        process.terminate()
+        try:
+            process.wait(timeout=3)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        raise
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    return returncode
+
+def _run_python(file_path, language):
+    # Try to install dependencies first
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read(HEAD_READ_SIZE)
+        if len(content) == HEAD_READ_SIZE:
+            # Finish the last line so a marker cut at the boundary is still matched
+            content += f.readline()
+        
+    # Look for requirements comment
+    req_match = _REQ_RE.search(content)
+    if req_match:
+        reqs = [r.strip() for r in req_match.group(1).split(",") if r.strip()]
+        missing = [r for r in reqs if _needs_install(r)]
+        if missing:
+            console.print(f"[cyan]Installing dependencies: {', '.join(missing)}[/cyan]")
+            subprocess.run(
+                [sys.executable, "-m", "pip", "install", "-q", "--disable-pip-version-check", "--no-input"] + missing,
+                check=False
+            )
+    else:
+        # Fallback: Naive import detection
+        # (Only simple top-level imports). Import names are not PyPI names, so these
+        # are only reported, never installed.
+        imports = _IMPORT_RE.findall(content)
+        detected_pkgs = set()
+        for imp in imports:
+            pkg = imp[0] or imp[1]
+            if pkg and pkg not in _BUILTINS and pkg != 'streamlit': # simplified check
+                 detected_pkgs.add(pkg)
+        script_dir = os.path.dirname(_abs(file_path))
+        unresolved = sorted(
+            pkg for pkg in detected_pkgs
+            if find_spec(pkg) is None
+            # A sibling module or package is a local import, not a missing package
+            and not os.path.exists(os.path.join(script_dir, pkg + ".py"))
+            and not os.path.isdir(os.path.join(script_dir, pkg))
+        )
+        if unresolved:
+            console.print(f"[yellow]Hint: these imports are not installed: {', '.join(unresolved)}. "
+                          f"Add a '# requirements:' comment to install them automatically.[/yellow]")
+    
+    # Heuristic: if it imports streamlit, run with streamlit
+    if "import streamlit" in content:
+        _run_foreground(["streamlit", "run", file_path])
+    else:
+        _run_foreground(["python", file_path])
+
+def _run_html(file_path, language):
+    # Open in default browser
+    import webbrowser
+    url = "file://" + _abs(file_path)
+    console.print(f"[green]Opening {url}...[/green]")
+    webbrowser.open(url)
+
+def _run_cpp(file_path, language):
+    # For C++, we want to avoid local compilation if possible and just show the code 
+    # OR run it if a compiler exists.
+    # User requested "run without those compilers".
+    # Strict interpretation: we can't run C++ source without a compiler/interpreter.
+    # However, we can simulate "running" by displaying the source or opening an online compiler.
+    
+    if shutil.which("g++"):
+        # Compiler exists, try to run
+        exe_path = file_path.replace(".cpp", ".exe" if sys.platform == "win32" else "")
+        hash_path = exe_path + ".hash"
+        with open(file_path, "rb") as f:
+            source_hash = hashlib.sha256(f.read()).hexdigest()
+
+        # Skip the compiler when the source is unchanged since the last build
+        previous_hash = None
+        if os.path.exists(exe_path):
+            try:
+                with open(hash_path, "r") as f:
+                    previous_hash = f.read().strip()
+            except OSError:
+                pass
+
+        if previous_hash == source_hash:
+            console.print("[cyan]Source unchanged, reusing previous build.[/cyan]")
+            compiled = True
+        else:
+            console.print("[cyan]Compiling locally...[/cyan]")
+            compile_result = subprocess.run(
+                ["g++", "-O2", "-pipe", "-std=c++17", file_path, "-o", exe_path],
+                capture_output=True, text=True
+            )
+            compiled = compile_result.returncode == 0
+            if compiled:
+                with open(hash_path, "w") as f:
+                    f.write(source_hash)
+
+        if compiled:
+            console.print("[cyan]Running in new console...[/cyan]")
+            if sys.platform == "win32":
+                # Empty "" is the window title argument expected by start
+                subprocess.Popen(["cmd", "/c", "start", "", "cmd", "/k", exe_path])
+            else:
+                subprocess.run([exe_path])
+            return
+
+    # If no compiler or compilation failed, use Online Automation
+    console.print("[yellow]Local C++ compiler not found. Using Programiz Online Compiler...[/yellow]")
+    
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            code_content = f.read()
+        run_online_cpp_programiz(code_content)
+    except Exception as e:
+        console.print(f"[red]Error reading C++ file: {e}[/red]")
+
+def _run_fallback(file_path, language):
+    console.print(f"[yellow]Unknown runner for language {language}. Opening file...[/yellow]")
+    if sys.platform == "win32":
+         try:
+             os.startfile(file_path)
+         except OSError as e:
+             console.print(f"[bold red]Could not open file:[/bold red] {e}")
+
+_LANG_BY_EXT = {".py": "python", ".html": "html", ".cpp": "c++"}
+_EXT_BY_LANG = {v: k for k, v in _LANG_BY_EXT.items()}
+_LANG_DISPATCH = {"python": _run_python, "html": _run_html, "c++": _run_cpp}
+
 def run_app(app_entry):
     """
-    Runs the app based on its language.
+    Runs the app based on its language, falling back to the file extension.
     """
     file_path = app_entry["path"]
     language = app_entry.get("language", "auto").lower()
     
     console.print(f"[bold green]Running {app_entry['name']}...[/bold green]")
     
+    runner = _LANG_DISPATCH.get(language) or _LANG_DISPATCH.get(_LANG_BY_EXT.get(os.path.splitext(file_path)[1]), _run_fallback)
     try:
-        if language == "python" or file_path.endswith(".py"):
-            # Try to install dependencies first
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                
-            # Look for requirements comment
-            req_match = re.search(r"#\s*requirements:\s*(.*)", content, re.IGNORECASE)
-            if req_match:
-                reqs = [r.strip() for r in req_match.group(1).split(",") if r.strip()]
-                if reqs:
-                    console.print(f"[cyan]Installing dependencies: {', '.join(reqs)}[/cyan]")
-                    subprocess.run([sys.executable, "-m", "pip", "install"] + reqs, check=False)
-            
-            # Fallback: Naive import detection
-            # (Only simple top-level imports)
-            imports = re.findall(r"^import (\w+)|^from (\w+)", content, re.MULTILINE)
-            detected_pkgs = set()
-            for imp in imports:
-                pkg = imp[0] or imp[1]
-                if pkg and pkg not in sys.builtin_module_names and pkg not in ['streamlit']: # simplified check
-                     detected_pkgs.add(pkg)
-            
-            # Heuristic: if it imports streamlit, run with streamlit
-            if "import streamlit" in content:
-                subprocess.run(["streamlit", "run", file_path], check=True)
-            else:
-                subprocess.run(["python", file_path], check=True)
-        elif language == "html" or file_path.endswith(".html"):
-             # Open in default browser
-             url = "file://" + os.path.abspath(file_path)
-             console.print(f"[green]Opening {url}...[/green]")
-             webbrowser.open(url)
-        elif language == "c++" or file_path.endswith(".cpp"):
-             # For C++, we want to avoid local compilation if possible and just show the code 
-             # OR run it if a compiler exists.
-             # User requested "run without those compilers".
-             # Strict interpretation: we can't run C++ source without a compiler/interpreter.
-             # However, we can simulate "running" by displaying the source or opening an online compiler.
-             
-             if shutil.which("g++"):
-                 # Compiler exists, try to run
-                 exe_path = file_path.replace(".cpp", ".exe" if sys.platform == "win32" else "")
-                 console.print("[cyan]Compiling locally...[/cyan]")
-                 compile_result = subprocess.run(["g++", file_path, "-o", exe_path], capture_output=True, text=True)
-                 if compile_result.returncode == 0:
-                     console.print("[cyan]Running in new console...[/cyan]")
-                     if sys.platform == "win32":
-                         os.system(f'start cmd /k "{exe_path}"')
-                     else:
-                         subprocess.run([exe_path])
-                     return
-
-             # If no compiler or compilation failed, use Online Automation
-             console.print("[yellow]Local C++ compiler not found. Using Programiz Online Compiler...[/yellow]")
-             
-             try:
-                 with open(file_path, "r", encoding="utf-8") as f:
-                     code_content = f.read()
-                 run_online_cpp_programiz(code_content)
-             except Exception as e:
-                 console.print(f"[red]Error reading C++ file: {e}[/red]")
-             
-        else:
-            console.print(f"[yellow]Unknown runner for language {language}. Opening file...[/yellow]")
-            if sys.platform == "win32":
-                 os.startfile(file_path)
+        runner(file_path, language)
     except KeyboardInterrupt:
         console.print("\n[yellow]App stopped.[/yellow]")
     except Exception as e:
         console.print(f"[bold red]Error running app:[/bold red] {e}")
 
+# Language-specific prompt instructions, keyed by lowercased language name
+_LANG_INSTR = {
+    "python": (
+        "Write a complete Python Streamlit application. "
+        "List all required pip packages in a comment at the top of the file like this: '# requirements: pandas, numpy'. "
+        "Include error handling (try/except blocks) for robustness. "
+        "IMPORTANT: Include a sidebar with an 'Intuitive User Interface (UI) Builder' section. "
+        "This section should allow users to customize colors, fonts, and layout options (e.g., columns, spacing) using Streamlit widgets (color_picker, selectbox, slider)."
+    ),
+    "html": (
+        "Write a complete HTML application. "
+        "Use modern CSS (Flexbox/Grid) for layout. "
+        "If interactive, include vanilla JavaScript within <script> tags. "
+        "The UI should include a 'drag-and-drop' style editor interface simulation where possible, "
+        "allowing users to customize layout colors or fonts dynamically."
+    ),
+    "c++": (
+        "Write a complete C++ console application. "
+        "If possible, make it compatible with WebAssembly (Emscripten) by using standard libraries."
+    ),
+}
+
 def get_copilot_suggestion(query, language, color_scheme="default", complex_app=False, architecture="Standard", extras=None):
     """
     Get a suggestion from GitHub Copilot CLI.
     """
     extras = extras or []
     
-    lang_instruction = ""
-    if language.lower() == "python":
-        lang_instruction = (
-            "Write a complete Python Streamlit application. "
-            "List all required pip packages in a comment at the top of the file like this: '# requirements: pandas, numpy'. "
-            "Include error handling (try/except blocks) for robustness. "
-            "IMPORTANT: Include a sidebar with an 'Intuitive User Interface (UI) Builder' section. "
-            "This section should allow users to customize colors, fonts, and layout options (e.g., columns, spacing) using Streamlit widgets (color_picker, selectbox, slider)."
-        )
-    elif language.lower() == "html":
-        lang_instruction = (
-            "Write a complete HTML application. "
-            "Use modern CSS (Flexbox/Grid) for layout. "
-            "If interactive, include vanilla JavaScript within <script> tags. "
-            "The UI should include a 'drag-and-drop' style editor interface simulation where possible, "
-            "allowing users to customize layout colors or fonts dynamically."
-        )
-    elif language.lower() == "c++":
-        lang_instruction = (
-            "Write a complete C++ console application. "
-            "If possible, make it compatible with WebAssembly (Emscripten) by using standard libraries."
-        )
-    else: # Fallback or specific future languages
-        lang_instruction = f"Write a complete application in {language}."
+    lang_instruction = _LANG_INSTR.get(language.lower(), f"Write a complete application in {language}.")
 
     complexity_instruction = ""
     if complex_app:
@@ -258,49 +626,45 @@ def get_copilot_suggestion(query, language, color_scheme="default", complex_app=
         complexity_instruction = "The code must be self-contained in a single file."
 
     # Construct the advanced prompt
-    full_prompt = (
-        f"Primary User Request: {query}\n\n"
-        f"Technical Specifications (Extensions of the request):\n"
-        f"- Target Language: {language}\n"
-        f"- Visual Style: {color_scheme}\n"
-        f"- Architecture/Pattern: {architecture}\n"
-        f"- Complexity: {'Complex (Multi-file)' if complex_app else 'Single-file/Simple'}\n"
-        f"- Additional Features Requested: {', '.join(extras)}\n"
-        f"- Language Specifics: {lang_instruction}\n"
-        f"- Complexity Details: {complexity_instruction}\n\n"
+    parts = [
+        f"Primary User Request: {query}",
+        "",
+        "Technical Specifications (Extensions of the request):",
+        f"- Target Language: {language}",
+        f"- Visual Style: {color_scheme}",
+        f"- Architecture/Pattern: {architecture}",
+        "- Complexity: " + ("Complex (Multi-file)" if complex_app else "Single-file/Simple"),
+        "- Additional Features Requested: " + ", ".join(extras),
+        f"- Language Specifics: {lang_instruction}",
+        f"- Complexity Details: {complexity_instruction}",
+        "",
         "Generate the application code exactly matching the Primary User Request. The Technical Specifications act as extensions/constraints to the prompt. "
-        "Return the code in markdown code blocks."
-    )
+        "Return the code in markdown code blocks.",
+    ]
+    full_prompt = "\n".join(parts)
     
     # Improved Loading Animation
     with console.status(f"[bold cyan]Consulting GitHub Copilot for a {color_scheme} {language} app (Arch: {architecture})...[/bold cyan]", spinner="bouncingBall"):
-        cmd = ["gh", "copilot", "-p", full_prompt, "--silent"]
-        
         try:
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                shell=False
-            )
+            process = run_copilot_prompt(full_prompt)
             
-            if process.returncode == 0 and process.stdout.strip():
-                return process.stdout.strip()
-            elif process.stderr.strip():
-                 return f"Error/Message: {process.stderr.strip()}"
-            
-            return None
+            if process.returncode != 0:
+                return f"Error: {process.stderr.strip()[:500]}"
+            out = process.stdout.strip()
+            return out if out else None
         except Exception as e:
             return f"Execution Error: {str(e)}"
 
 
 def show_splash_screen():
     console.clear()
+    # Skip the cosmetic delays when piped or when APPGEN_FAST is set
+    fast = bool(os.environ.get("APPGEN_FAST")) or not sys.stdout.isatty()
     
     # Advanced System Boot Simulation
     console.print(Panel("[bold cyan]INITIALIZING ADVANCED APP GENERATOR CORE V2.0[/bold cyan]", border_style="cyan"))
-    time.sleep(0.5)
+    if not fast:
+        time.sleep(0.5)
     
     with Progress(
         SpinnerColumn(),
@@ -314,6 +678,10 @@ def show_splash_screen():
         task2 = progress.add_task("[cyan]Connecting to Neural Network...", total=100)
         task3 = progress.add_task("[magenta]Loading Architecture Modules...", total=100)
         
+        if fast:
+            for task in (task1, task2, task3):
+                progress.update(task, completed=100)
+        
         while not progress.finished:
             if not progress.finished:
                 progress.update(task1, advance=random.randint(2, 5))
@@ -324,6 +692,7 @@ def show_splash_screen():
             time.sleep(0.05)
             
     # System Status Table
+    from rich.table import Table
     table = Table(title="System Status", show_header=True, header_style="bold magenta")
     table.add_column("Module", style="cyan")
     table.add_column("Status", style="green")
@@ -333,6 +702,8 @@ def show_splash_screen():
     os_info = f"{sys.platform} ({os.name})"
     py_version = sys.version.split()[0]
     gh_status = "Connected" if shutil.which("gh") else "Not Found"
+    if gh_status == "Connected":
+        warm_up_copilot()
     
     table.add_row("Operating System", "ONLINE", os_info)
     table.add_row("Python Environment", "ONLINE", f"v{py_version}")
@@ -341,7 +712,8 @@ def show_splash_screen():
     
     console.print(table)
     console.print("\n[bold green]>> SYSTEM READY. WAITING FOR INPUT...[/bold green]\n")
-    time.sleep(1)
+    if not fast:
+        time.sleep(1)
 
 
 def main():
@@ -361,16 +733,7 @@ def main():
                 "Refine/Fix Existing App",
                 "Exit"
             ],
-            style=questionary.Style([
-                ('qmark', 'fg:#E91E63 bold'),       # pink
-                ('question', 'fg:#673AB7 bold'),    # purple
-                ('answer', 'fg:#2196f3 bold'),      # blue
-                ('pointer', 'fg:#673AB7 bold'),     # purple
-                ('highlighted', 'fg:#E91E63 bold'), # pink
-                ('selected', 'fg:#cc5454'),         # orange
-                ('separator', 'fg:#cc5454'),
-                ('instruction', 'fg:#a0a0a0 italic')
-            ])
+            style=_MENU_STYLE
         ).ask()
         
         if choice == "Exit":
@@ -383,6 +746,7 @@ def main():
                 console.print("[yellow]No apps found in registry.[/yellow]")
                 continue
                 
+            from rich.table import Table
             table = Table(title="Generated Apps")
             table.add_column("ID", style="cyan")
             table.add_column("Name", style="green")
@@ -391,9 +755,12 @@ def main():
             table.add_column("Features")
             table.add_column("Created At")
             
-            for app in registry:
-                features_str = ", ".join(app.get("features", []))[:30]
-                table.add_row(app["id"], app["name"], app["language"], app["description"][:30], features_str, app["created_at"])
+            rows = [
+                (a["id"], a["name"], a["language"], (a["description"] or "")[:30], _short_features(a), a["created_at"])
+                for a in registry
+            ]
+            for row in rows:
+                table.add_row(*row)
                 
             console.print(table)
             
@@ -440,14 +807,14 @@ def main():
             )
             
             with console.status("[bold cyan]Consulting GitHub Copilot for refinement...[/bold cyan]", spinner="bouncingBall"):
-                 cmd = ["gh", "copilot", "-p", full_prompt, "--silent"]
                  try:
-                    process = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', shell=False)
+                    process = run_copilot_prompt(full_prompt)
                     suggestion = process.stdout.strip() if process.returncode == 0 else None
                  except:
                     suggestion = None
             
             if suggestion:
+                from rich.markdown import Markdown
                 console.print("\n[bold cyan]Copilot Suggestion:[/bold cyan]")
                 console.print(Panel(Markdown(suggestion), border_style="green"))
                 
@@ -455,8 +822,7 @@ def main():
                 if new_code_blocks:
                      if Confirm.ask("Do you want to overwrite the existing file with this update?"):
                          lang, code = new_code_blocks[0]
-                         with open(selected_app["path"], "w", encoding="utf-8") as f:
-                             f.write(code)
+                         _write_if_changed(selected_app["path"], code)
                          console.print("[green]App updated successfully![/green]")
                          if Confirm.ask("Run updated app?"):
                              run_app(selected_app)
@@ -538,6 +904,7 @@ def main():
         suggestion = get_copilot_suggestion(user_query, selected_language, color_scheme, is_complex, architecture, extras)
 
         if suggestion:
+            from rich.markdown import Markdown
             # Display Copilot's Explanation first (as requested)
             console.print("\n[bold cyan]Copilot Response:[/bold cyan]")
             console.print(Panel(Markdown(suggestion), border_style="green"))
@@ -584,8 +951,7 @@ def main():
                             fname = Prompt.ask(f"Enter filename for this block", default=default_fname)
                             
                             full_path = os.path.join(app_name, fname)
-                            with open(full_path, "w", encoding="utf-8") as f:
-                                f.write(code)
+                            _write_if_changed(full_path, code)
                             console.print(f"[green]Saved {full_path}[/green]")
                             
                             if i == 0: saved_path = full_path # Main entry point usually first
@@ -593,15 +959,12 @@ def main():
                     else:
                         # Single file
                         lang, code = code_blocks[0]
-                        ext = ".py"
-                        if selected_language == "HTML": ext = ".html"
-                        elif selected_language == "C++": ext = ".cpp"
-                        elif "python" in lang: ext = ".py"
-                        elif "html" in lang: ext = ".html"
+                        ext = _EXT_BY_LANG.get(selected_language.lower(), ".py")
+                        # For Python, an explicit html fence still wins
+                        if ext == ".py" and "python" not in lang and "html" in lang: ext = ".html"
                         
                         filename = f"{app_name}{ext}"
-                        with open(filename, "w", encoding="utf-8") as f:
-                            f.write(code)
+                        _write_if_changed(filename, code)
                         saved_path = filename
                         console.print(f"[bold green]File saved to {filename}[/bold green]")
                     
@@ -612,7 +975,7 @@ def main():
                         # Create a temporary app entry to run it immediately
                         temp_entry = {
                             "name": app_name,
-                            "path": os.path.abspath(saved_path),
+                            "path": _abs(saved_path),
                             "language": selected_language
                         }
                         run_app(temp_entry)
@@ -621,10 +984,7 @@ def main():
                 console.print("[yellow]No markdown code blocks found in the response.[/yellow]")
                 if Confirm.ask("Do you want to save the raw output as a file?"):
                     app_name = Prompt.ask("Enter a name for this app (no spaces)", default=f"app_{int(time.time())}")
-                    ext = ".txt"
-                    if "python" in selected_language.lower(): ext = ".py"
-                    elif "html" in selected_language.lower(): ext = ".html"
-                    elif "c++" in selected_language.lower(): ext = ".cpp"
+                    ext = _EXT_BY_LANG.get(selected_language.lower(), ".txt")
                     
                     filename = f"{app_name}{ext}"
                     with open(filename, "w", encoding="utf-8") as f:
@@ -636,7 +996,7 @@ def main():
                     if Confirm.ask("Try to run this file?"):
                          temp_entry = {
                             "name": app_name,
-                            "path": os.path.abspath(filename),
+                            "path": _abs(filename),
                             "language": selected_language
                         }
                          run_app(temp_entry)